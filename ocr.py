@@ -6,11 +6,19 @@ Usage examples:
   - Language:   python ocr.py image.jpg -l eng
   - PSM mode:   python ocr.py image.jpg --psm 6
   - To file:    python ocr.py image.jpg -o output.txt
+  - Batch:      python ocr.py scans/ -o out_dir --jobs 4
+  - Daemon:     python ocr.py --daemon   (then: python ocr.py --client image.jpg)
 
 Dependencies:
-  - Python packages: Pillow, pytesseract
+  - Python packages: Pillow, NumPy, pytesseract (or tesserocr)
   - System binary: Tesseract OCR (required at runtime)
 
+When tesserocr is installed it is used instead of pytesseract: the engine is
+initialized once per (lang, oem) and reused for every image, instead of
+spawning a fresh `tesseract` process per call. To benefit, OCR many files from
+one Python process rather than running the CLI once per file, or keep a
+`--daemon` running and send images to it with `--client`.
+
 Install Tesseract:
   - macOS (Homebrew):   brew install tesseract
   - Ubuntu/Debian:      sudo apt-get update && sudo apt-get install -y tesseract-ocr
@@ -23,24 +31,128 @@ the Tesseract command path via the environment variable TESSERACT_CMD.
 from __future__ import annotations
 
 import argparse
+import functools
+import glob
+import json
 import os
+import socket
+import socketserver
+import stat
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Pool, current_process
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
 from PIL import Image, ImageOps, ImageFilter
 
+try:
+    import cv2
+except ImportError:  # pragma: no cover
+    cv2 = None
+
+try:
+    from turbojpeg import TJPF_GRAY, TJPF_RGB, TurboJPEG
+except ImportError:  # pragma: no cover
+    TurboJPEG = None
+
+try:
+    import tesserocr
+except ImportError:  # pragma: no cover
+    tesserocr = None
+
 try:
     import pytesseract
 except Exception as e:  # pragma: no cover
-    print(
-        "Error: pytesseract not installed. Add 'pytesseract' to requirements and pip install.",
-        file=sys.stderr,
-    )
-    raise
+    if tesserocr is None:
+        print(
+            "Error: pytesseract not installed. Add 'pytesseract' to requirements and pip install.",
+            file=sys.stderr,
+        )
+        raise
+    pytesseract = None
+
+
+# 3x3 sharpen with only the centre and its 4 neighbours set: five taps per
+# pixel instead of nine. Used by the OpenCV path; the PIL fallback keeps
+# ImageFilter.SHARPEN.
+_SHARPEN_KERNEL = np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]], dtype=np.float32)
+
+
+def _default_socket() -> Path:
+    """Return the per-user daemon socket path.
+
+    $XDG_RUNTIME_DIR is private to the user already; otherwise the socket
+    goes in an ``ocr-<uid>`` directory under the temp dir, created 0700 on
+    use, so other users cannot replace it or connect to it.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "ocr.sock"
+    return Path(tempfile.gettempdir()) / f"ocr-{os.getuid()}" / "ocr.sock"
+
+
+DEFAULT_SOCKET = _default_socket()
+
+_JPEG_SUFFIXES = {".jpg", ".jpeg"}
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".gif", ".webp"}
+
+# Initialized tesserocr engines, keyed by (lang, oem). Both are fixed when the
+# models are loaded; the page segmentation mode is set per call instead, so
+# each entry is [engine, current psm] to skip setter calls that would not
+# change anything.
+_APIS: dict[tuple[str, Optional[int]], list[Any]] = {}
+
+# Tesseract's page segmentation mode when none is given (PSM.AUTO).
+_PSM_AUTO = 3
 
 
-def _ensure_tesseract_available() -> None:
+def _get_api(lang: str, psm: Optional[int], oem: Optional[int]) -> Any:
+    """Return a cached tesserocr engine configured for the given settings.
+
+    Loading the language models is the expensive part of Tesseract, so each
+    (lang, oem) engine is initialized once per process and reused afterwards.
+    Switching ``psm`` only calls SetPageSegMode, and only when it differs.
+    """
+    psm = _PSM_AUTO if psm is None else psm
+    key = (lang, oem)
+    entry = _APIS.get(key)
+    if entry is None:
+        entry = _APIS[key] = [_create_api(lang, psm, oem), psm]
+
+    api, current_psm = entry
+    if current_psm != psm:
+        api.SetPageSegMode(psm)
+        entry[1] = psm
+    return api
+
+
+def _create_api(lang: str, psm: int, oem: Optional[int]) -> Any:
+    kwargs: dict[str, Any] = {"lang": lang, "psm": psm}
+    if oem is not None:
+        kwargs["oem"] = oem
+    try:
+        return tesserocr.PyTessBaseAPI(**kwargs)
+    except RuntimeError as exc:
+        raise RuntimeError(
+            f"Failed to initialize Tesseract for lang={lang!r}. "
+            "Check that the language data is installed or set TESSDATA_PREFIX.\n"
+            f"Original error: {exc}"
+        ) from exc
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_tesseract_available() -> bool:
+    """Check once per process that Tesseract can be run.
+
+    Failures are not cached, so a later call retries the probe.
+    """
+    if tesserocr is not None:
+        # Engine initialization in _get_api reports missing data itself.
+        return True
     try:
         _ = pytesseract.get_tesseract_version()
     except Exception as exc:
@@ -53,11 +165,84 @@ def _ensure_tesseract_available() -> None:
             f"Original error: {exc}"
         )
         raise RuntimeError(msg) from exc
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _turbojpeg() -> Optional[Any]:
+    """Return a shared TurboJPEG decoder, or None if libjpeg-turbo is unavailable."""
+    if TurboJPEG is None:
+        return None
+    try:
+        return TurboJPEG()
+    except Exception:
+        # The Python binding is installed but the shared library is not.
+        return None
 
 
-def load_image(path: Path) -> Image.Image:
+def load_image(path: Path, mode: str = "RGB") -> Image.Image:
+    """Open an image and convert it to ``mode``.
+
+    JPEGs are decoded with libjpeg-turbo (PyTurboJPEG) when available. With
+    PIL, ``draft`` makes the JPEG decoder produce ``mode`` directly. Either
+    way a grayscale load never materializes an RGB copy first.
+    """
+    path = Path(path)
+    if mode in ("L", "RGB") and path.suffix.lower() in _JPEG_SUFFIXES:
+        jpeg = _turbojpeg()
+        if jpeg is not None:
+            try:
+                pixel_format = TJPF_GRAY if mode == "L" else TJPF_RGB
+                arr = jpeg.decode(path.read_bytes(), pixel_format=pixel_format)
+                return Image.fromarray(arr[..., 0] if mode == "L" else arr)
+            except Exception:
+                pass  # e.g. CMYK or damaged files; let PIL handle them
     with Image.open(path) as im:
-        return im.convert("RGB")
+        im.draft(mode, im.size)
+        return im.convert(mode)
+
+
+BINARIZE_MODES = ("none", "otsu", "adaptive")
+
+# Neighbourhood size and offset for adaptive (local) thresholding.
+_ADAPTIVE_BLOCK_SIZE = 31
+_ADAPTIVE_C = 10
+
+
+def downscale_image(img: Image.Image, max_dim: Optional[int]) -> Image.Image:
+    """Shrink img so its longer side is at most max_dim pixels.
+
+    Recognition cost grows with the pixel count, and pages scanned well
+    above ~300 DPI gain no accuracy from the extra resolution. A missing or
+    non-positive max_dim means no limit.
+    """
+    if max_dim is None or max_dim <= 0:
+        return img
+    w, h = img.size
+    scale = max_dim / max(w, h)
+    if scale >= 1.0:
+        return img
+    size = (max(1, round(w * scale)), max(1, round(h * scale)))
+    return img.resize(size, Image.LANCZOS)
+
+
+# Fused sharpen/threshold kernel for the PIL path, set by _enable_jit(). Importing
+# Numba and compiling the kernel cost over a second per process, more than the
+# PIL chain takes for a single page, so it is only built for processes that OCR
+# many images (batch, daemon).
+_sharpen_threshold: Optional[Any] = None
+
+
+def _enable_jit() -> None:
+    global _sharpen_threshold
+    # The kernel only replaces the PIL path, so skip the import when OpenCV is used.
+    if cv2 is not None or _sharpen_threshold is not None:
+        return
+    try:
+        import numba
+    except ImportError:  # pragma: no cover
+        return
+    _sharpen_threshold = _compile_sharpen_threshold(numba)
 
 
 def preprocess_image(
@@ -66,8 +251,54 @@ def preprocess_image(
     sharpen: bool = True,
     threshold: Optional[int] = None,
     denoise: Optional[str] = None,
+    binarize: Optional[str] = None,
 ) -> Image.Image:
-    if grayscale:
+    """Prepare an image for OCR.
+
+    A fixed ``threshold`` takes precedence; otherwise ``binarize`` selects
+    automatic binarization: "otsu" picks one global cutoff from the
+    histogram, "adaptive" thresholds each pixel against its neighbourhood
+    (requires OpenCV) and copes better with uneven lighting.
+    """
+    if binarize == "none":
+        binarize = None
+    if binarize not in (None, "otsu", "adaptive"):
+        raise ValueError(f"Unknown binarize mode: {binarize!r}")
+    if threshold is not None:
+        binarize = None
+    elif binarize == "adaptive" and cv2 is None:
+        raise RuntimeError(
+            "Adaptive binarization requires OpenCV. Install it with: pip install opencv-python"
+        )
+    if img.mode == "1":
+        # Already binary: sharpening and thresholding would leave it unchanged.
+        if not denoise:
+            return img
+        img = img.convert("L")
+        sharpen = False
+        threshold = binarize = None
+
+    if cv2 is not None:
+        return _preprocess_cv2(
+            img,
+            grayscale=grayscale,
+            sharpen=sharpen,
+            threshold=threshold,
+            denoise=denoise,
+            binarize=binarize,
+        )
+    # Without OpenCV, sharpen and threshold can still be fused into one pass.
+    if (
+        _sharpen_threshold is not None
+        and sharpen
+        and threshold is not None
+        and not denoise
+        and (grayscale or img.mode == "L")
+    ):
+        gray = img if img.mode == "L" else ImageOps.grayscale(img)
+        threshold = max(0, min(255, threshold))
+        return Image.fromarray(_sharpen_threshold(np.asarray(gray), threshold))
+    if (grayscale or binarize) and img.mode != "L":
         img = ImageOps.grayscale(img)
     if sharpen:
         img = img.filter(ImageFilter.SHARPEN)
@@ -76,28 +307,123 @@ def preprocess_image(
             img = img.filter(ImageFilter.MedianFilter(size=3))
         elif denoise == "blur":
             img = img.filter(ImageFilter.GaussianBlur(radius=0.8))
+    if threshold is None and binarize == "otsu":
+        threshold = _otsu_threshold(np.asarray(img))
     if threshold is not None:
         threshold = max(0, min(255, threshold))
-        img = img.point(lambda p: 255 if p > threshold else 0)
+        # A precomputed table is applied by PIL in C, with no Python call per pixel.
+        lut = bytes(255 if i > threshold else 0 for i in range(256))
+        img = img.point(lut * len(img.getbands()))
     return img
 
 
-def _deskew_with_tesseract(img: Image.Image) -> Image.Image:
+def _otsu_threshold(gray: np.ndarray) -> int:
+    """Return the Otsu threshold of a uint8 grayscale array.
+
+    Picks the cutoff that maximizes the between-class variance of the
+    histogram; pixels above it are foreground, matching cv2.THRESH_OTSU.
+    """
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    weight_bg = np.cumsum(hist)
+    weight_fg = weight_bg[-1] - weight_bg
+    mass_bg = np.cumsum(hist * np.arange(256))
+    mean_total = mass_bg[-1] / weight_bg[-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        between = (mean_total * weight_bg - mass_bg) ** 2 / (weight_bg * weight_fg)
+    return int(np.argmax(np.nan_to_num(between, nan=0.0, posinf=0.0)))
+
+
+def _preprocess_cv2(
+    img: Image.Image,
+    grayscale: bool,
+    sharpen: bool,
+    threshold: Optional[int],
+    denoise: Optional[str],
+    binarize: Optional[str] = None,
+) -> Image.Image:
+    """OpenCV version of preprocess_image working on a single NumPy array.
+
+    The pixels are read out of PIL once and every stage runs on the array, so
+    no intermediate PIL images are created between the steps.
+    """
+    if img.mode not in ("L", "RGB"):
+        img = img.convert("L" if img.mode in ("1", "LA") else "RGB")
+    arr = np.asarray(img)
+    if (grayscale or binarize) and arr.ndim == 3:
+        arr = cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
+    if sharpen:
+        arr = cv2.filter2D(arr, -1, _SHARPEN_KERNEL)
+    if denoise == "median":
+        arr = cv2.medianBlur(arr, 3)
+    elif denoise == "blur":
+        arr = cv2.GaussianBlur(arr, (0, 0), sigmaX=0.8)
+    if threshold is not None:
+        threshold = max(0, min(255, threshold))
+        _, arr = cv2.threshold(arr, threshold, 255, cv2.THRESH_BINARY)
+    elif binarize == "otsu":
+        _, arr = cv2.threshold(arr, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    elif binarize == "adaptive":
+        arr = cv2.adaptiveThreshold(
+            arr,
+            255,
+            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+            cv2.THRESH_BINARY,
+            _ADAPTIVE_BLOCK_SIZE,
+            _ADAPTIVE_C,
+        )
+    return Image.fromarray(arr)
+
+
+# Page segmentation mode that runs orientation and script detection only.
+_PSM_OSD_ONLY = 0
+
+# Std-dev of the row-mean profile (uint8 scale) above which horizontal text
+# lines are clearly visible and the page is taken to be upright.
+_UPRIGHT_ROW_STD = 8.0
+
+
+def _compile_sharpen_threshold(numba: Any) -> Any:
+    """Return ImageFilter.SHARPEN and a fixed threshold fused into one Numba kernel."""
+
+    @numba.njit(parallel=True)
+    def sharpen_threshold(gray: np.ndarray, threshold: int) -> np.ndarray:
+        """Sharpen like ImageFilter.SHARPEN and threshold in a single pass.
+
+        Rows are processed in parallel and each output pixel is written once,
+        instead of materializing the sharpened image before thresholding.
+        Weights, rounding and the unfiltered border match PIL, so the result
+        is the same as the PIL chain.
+        """
+        h, w = gray.shape
+        out = np.empty((h, w), dtype=np.uint8)
+        for y in numba.prange(h):
+            for x in range(w):
+                value = np.int32(gray[y, x])
+                if 0 < y < h - 1 and 0 < x < w - 1:
+                    ring = -value
+                    for dy in range(-1, 2):
+                        for dx in range(-1, 2):
+                            ring += np.int32(gray[y + dy, x + dx])
+                    # 32 at the centre and -2 around it, divided by 16 rounding
+                    # half up, then clipped to 0..255.
+                    value = min(max((32 * value - 2 * ring + 8) >> 4, 0), 255)
+                out[y, x] = 255 if value > threshold else 0
+        return out
+
+    return sharpen_threshold
+
+
+def _deskew_with_tesseract(img: Image.Image, fast: bool = False) -> Image.Image:
     """Estimate rotation via Tesseract OSD and rotate to deskew.
 
+    With ``fast``, OSD is skipped for pages that _looks_upright accepts,
+    which means upside-down pages are left as they are.
     Falls back to original image on failure.
     """
+    if fast and _looks_upright(img):
+        return img
     try:
-        osd = pytesseract.image_to_osd(img)
-        # OSD output often contains a line like: "Rotate: 90"
-        angle = None
-        for line in osd.splitlines():
-            if "Rotate:" in line:
-                try:
-                    angle = int(line.split(":", 1)[1].strip())
-                except Exception:
-                    pass
-                break
+        angle = _detect_rotation(img)
         if angle is not None and angle % 360 != 0:
             # Rotate in opposite direction to deskew
             return img.rotate(-angle, expand=True, fillcolor=255)
@@ -106,6 +432,156 @@ def _deskew_with_tesseract(img: Image.Image) -> Image.Image:
     return img
 
 
+def _looks_upright(img: Image.Image) -> bool:
+    """Cheap check for horizontal text lines, used to skip OSD.
+
+    Horizontal lines of text make the row-mean profile alternate between ink
+    and paper, so its spread is large and larger than the column profile's;
+    pages turned by 90 degrees show the opposite. Upside-down pages look the
+    same as upright ones to this check.
+    """
+    gray = img if img.mode == "L" else ImageOps.grayscale(img)
+    arr = np.asarray(gray, dtype=np.float32)
+    row_std = float(arr.mean(axis=1).std())
+    col_std = float(arr.mean(axis=0).std())
+    return row_std > _UPRIGHT_ROW_STD and row_std > col_std
+
+
+def _detect_rotation(img: Image.Image) -> Optional[int]:
+    """Return the clockwise rotation (degrees) that makes the page upright."""
+    if tesserocr is not None:
+        # Reuses a warm OSD engine instead of starting another tesseract process.
+        api = _get_api("osd", _PSM_OSD_ONLY, None)
+        _set_image(api, img)
+        osd = api.DetectOrientationScript()
+        if not osd:
+            return None
+        # orient_deg is the page's counter-clockwise orientation; convert it to
+        # the clockwise correction reported as "Rotate:" by the tesseract CLI.
+        return (360 - osd["orient_deg"]) % 360
+
+    osd = pytesseract.image_to_osd(img)
+    # OSD output often contains a line like: "Rotate: 90"
+    angle = None
+    for line in osd.splitlines():
+        if "Rotate:" in line:
+            try:
+                angle = int(line.split(":", 1)[1].strip())
+            except Exception:
+                pass
+            break
+    return angle
+
+
+def _set_image(api: Any, img: Image.Image) -> None:
+    """Pass the raw pixel buffer to a tesserocr engine.
+
+    api.SetImage(img) encodes the PIL image to an in-memory file that
+    Tesseract then decodes again; SetImageBytes hands over the pixels as-is.
+    """
+    if img.mode == "1":
+        img = img.convert("L")
+    if img.mode not in ("L", "RGB"):
+        api.SetImage(img)
+        return
+    width, height = img.size
+    bytes_per_pixel = len(img.getbands())
+    api.SetImageBytes(img.tobytes(), width, height, bytes_per_pixel, width * bytes_per_pixel)
+
+
+def _recognize(
+    img: Image.Image,
+    lang: str = "eng",
+    psm: Optional[int] = None,
+    oem: Optional[int] = None,
+) -> str:
+    """Run text recognition on an already preprocessed image."""
+    if tesserocr is not None:
+        api = _get_api(lang, psm, oem)
+        _set_image(api, img)
+        return api.GetUTF8Text()
+
+    # pytesseract forwards these as command-line arguments to the subprocess.
+    config_parts = []
+    if psm is not None:
+        config_parts.append(f"--psm {psm}")
+    if oem is not None:
+        config_parts.append(f"--oem {oem}")
+    config = " ".join(config_parts) if config_parts else None
+
+    return pytesseract.image_to_string(img, lang=lang, config=config)
+
+
+# Rows with a mean above this (uint8 scale) count as blank paper and are
+# candidate cut points for --tile-rows.
+_BLANK_ROW_MEAN = 250
+
+# Process pool for OCR'ing bands of one page; kept for the life of the process
+# so its workers hold on to their loaded Tesseract engines.
+_BAND_EXECUTOR: Optional[ProcessPoolExecutor] = None
+_BAND_WORKERS = 0
+
+
+def split_bands(img: Image.Image, count: int) -> list[Image.Image]:
+    """Split img into up to ``count`` horizontal bands, cutting on blank rows.
+
+    Each cut goes on the blank row closest to an even split point, so text
+    lines are never sliced. Blank means near-white, which binarized or clean
+    scans provide; pages without such rows are returned whole.
+    """
+    if count <= 1:
+        return [img]
+    gray = img if img.mode == "L" else img.convert("L")
+    row_means = np.asarray(gray, dtype=np.float32).mean(axis=1)
+    blank = np.flatnonzero(row_means > _BLANK_ROW_MEAN)
+    if blank.size == 0:
+        return [img]
+
+    height = img.height
+    cuts = [0]
+    for k in range(1, count):
+        target = k * height // count
+        cut = int(blank[np.argmin(np.abs(blank - target))])
+        if cuts[-1] < cut < height:
+            cuts.append(cut)
+    cuts.append(height)
+    return [img.crop((0, top, img.width, bottom)) for top, bottom in zip(cuts, cuts[1:])]
+
+
+def _band_executor(workers: int) -> ProcessPoolExecutor:
+    """Return the band pool, grown to ``workers`` processes (at most one per CPU).
+
+    Each worker loads its own Tesseract engine, so the pool is sized by the
+    number of bands rather than started with a process per CPU.
+    """
+    global _BAND_EXECUTOR, _BAND_WORKERS
+    workers = min(workers, os.cpu_count() or 1)
+    if _BAND_EXECUTOR is None or _BAND_WORKERS < workers:
+        if _BAND_EXECUTOR is not None:
+            _BAND_EXECUTOR.shutdown()
+        _BAND_EXECUTOR = ProcessPoolExecutor(max_workers=workers)
+        _BAND_WORKERS = workers
+    return _BAND_EXECUTOR
+
+
+def _ocr_bands(
+    bands: list[Image.Image],
+    lang: str,
+    psm: Optional[int],
+    oem: Optional[int],
+) -> str:
+    """OCR the bands of one page in parallel and join the text in order."""
+    recognize = functools.partial(_recognize, lang=lang, psm=psm, oem=oem)
+    if len(bands) == 1 or current_process().daemon:
+        # Batch pool workers are daemonic and may not start processes of their own.
+        texts = map(recognize, bands)
+    else:
+        texts = _band_executor(len(bands)).map(recognize, bands)
+    texts = list(texts)
+    # pytesseract ends each result with a form feed; keep only the page's last one.
+    return "".join([text.removesuffix("\f") for text in texts[:-1]] + texts[-1:])
+
+
 def ocr_image(
     image_path: Path,
     lang: str = "eng",
@@ -116,32 +592,279 @@ def ocr_image(
     sharpen: bool = True,
     denoise: Optional[str] = None,
     deskew: bool = False,
+    fast_deskew: bool = False,
+    binarize: Optional[str] = None,
+    max_dim: Optional[int] = None,
+    tile_rows: Optional[int] = None,
 ) -> str:
     _ensure_tesseract_available()
-    img = load_image(image_path)
-    if deskew:
-        img = _deskew_with_tesseract(img)
+    img = downscale_image(load_image(image_path, "L" if grayscale else "RGB"), max_dim)
+    if deskew or fast_deskew:
+        img = _deskew_with_tesseract(img, fast=fast_deskew)
     img = preprocess_image(
         img,
         grayscale=grayscale,
         sharpen=sharpen,
         threshold=threshold,
         denoise=denoise,
+        binarize=binarize,
     )
 
-    config_parts = []
-    if psm is not None:
-        config_parts.append(f"--psm {psm}")
-    if oem is not None:
-        config_parts.append(f"--oem {oem}")
-    config = " ".join(config_parts) if config_parts else None
+    if tile_rows and tile_rows > 1:
+        return _ocr_bands(split_bands(img, tile_rows), lang=lang, psm=psm, oem=oem)
+    return _recognize(img, lang=lang, psm=psm, oem=oem)
 
-    return pytesseract.image_to_string(img, lang=lang, config=config)
+
+def _expand_inputs(paths: list[Path]) -> list[Path]:
+    """Expand directories and glob patterns into a flat list of image paths."""
+    images: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            images.extend(
+                sorted(p for p in path.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES)
+            )
+        elif not path.exists() and glob.has_magic(str(path)):
+            images.extend(sorted(Path(p) for p in glob.glob(str(path))))
+        else:
+            images.append(path)
+    return images
+
+
+def _ocr_worker(
+    path: Path, options: dict[str, Any], socket_path: Optional[Path] = None
+) -> tuple[Path, Optional[str], Optional[str]]:
+    """Pool worker: OCR one image, returning (path, text, error)."""
+    try:
+        if socket_path is not None:
+            return path, ocr_via_daemon(socket_path, path, options), None
+        return path, ocr_image(path, **options), None
+    except Exception as exc:
+        return path, None, str(exc)
+
+
+def _output_names(images: list[Path]) -> dict[Path, str]:
+    """Map each image to its batch output file name.
+
+    Names are ``<stem>.txt``; images whose stems clash (``a.png`` and
+    ``a.jpg``) keep their suffix instead (``a.png.txt``). Raises ValueError
+    if two different images would still write the same file.
+    """
+    stems: dict[str, set[Path]] = {}
+    for path in images:
+        stems.setdefault(path.stem, set()).add(path)
+    names = {
+        path: f"{path.stem}.txt" if len(stems[path.stem]) == 1 else f"{path.name}.txt"
+        for path in images
+    }
+
+    owners: dict[str, Path] = {}
+    for path, name in names.items():
+        other = owners.setdefault(name, path)
+        if other != path:
+            raise ValueError(f"{other} and {path} would both be written to {name}")
+    return names
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write UTF-8 bytes to stdout without another pass through the text layer."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # stdout replaced by a text-only stream, e.g. StringIO
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _init_worker(lang: str, psm: Optional[int], oem: Optional[int]) -> None:
+    """Pool initializer: load this worker's Tesseract engine once, up front."""
+    _enable_jit()
+    try:
+        _ensure_tesseract_available()
+        if tesserocr is not None:
+            _get_api(lang, psm, oem)
+    except Exception:
+        # Raising here would make the pool respawn workers forever; the error
+        # is reported per image by _ocr_worker instead.
+        pass
+
+
+def _run_batch(
+    images: list[Path],
+    options: dict[str, Any],
+    output: Optional[Path],
+    jobs: Optional[int],
+    socket_path: Optional[Path] = None,
+) -> int:
+    """OCR many images across worker processes.
+
+    OCR is CPU-bound and Tesseract engines are not safe to share between
+    threads, so the work is spread over processes. Each worker loads its
+    engine once in _init_worker and reuses it for all the images it handles.
+    With ``socket_path`` the images are sent to the daemon one at a time
+    instead.
+    """
+    worker = functools.partial(_ocr_worker, options=options, socket_path=socket_path)
+    if socket_path is not None:
+        # The daemon handles one request at a time; more clients just queue.
+        jobs = 1
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(images)))
+    if output:
+        try:
+            names = _output_names(images)
+        except ValueError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 2
+        if output.exists() and not output.is_dir():
+            print(f"Error: {output} exists and is not a directory", file=sys.stderr)
+            return 2
+        output.mkdir(parents=True, exist_ok=True)
+
+    status = 0
+
+    def _emit(path: Path, text: Optional[str], error: Optional[str]) -> None:
+        nonlocal status
+        if error is not None:
+            print(f"OCR failed: {path}: {error}", file=sys.stderr)
+            status = 1
+        elif output:
+            out_path = output / names[path]
+            out_path.write_bytes(text.encode("utf-8"))
+            print(f"Wrote: {out_path}")
+        else:
+            _write_stdout(f"==> {path} <==\n{text}".encode("utf-8"))
+
+    if jobs == 1:
+        _enable_jit()
+        for result in map(worker, images):
+            _emit(*result)
+    else:
+        initargs = (options.get("lang", "eng"), options.get("psm"), options.get("oem"))
+        with Pool(processes=jobs, initializer=_init_worker, initargs=initargs) as pool:
+            for result in pool.imap_unordered(worker, images, chunksize=4):
+                _emit(*result)
+    return status
+
+
+class _OCRRequestHandler(socketserver.StreamRequestHandler):
+    """Serve one JSON request line: {"path": ..., "options": {...}}.
+
+    Replies with a JSON line holding either "text" or "error".
+    """
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            text = ocr_image(Path(request["path"]), **request.get("options", {}))
+            reply = {"text": text}
+        except Exception as exc:
+            reply = {"error": str(exc)}
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+def make_daemon(socket_path: Path) -> socketserver.UnixStreamServer:
+    """Create the OCR server bound to a Unix domain socket.
+
+    Requests are handled one at a time in this process, so the Tesseract
+    engines cached by _get_api stay loaded between requests. A leftover
+    socket from a previous run is replaced; anything else at socket_path,
+    including a live daemon's socket, raises RuntimeError, as does any OS
+    error while setting up the socket.
+    """
+    try:
+        if socket_path == DEFAULT_SOCKET:
+            _check_socket_dir(socket_path.parent)
+        _remove_stale_socket(socket_path)
+        return socketserver.UnixStreamServer(str(socket_path), _OCRRequestHandler)
+    except OSError as exc:
+        raise RuntimeError(f"Cannot listen on {socket_path}: {exc}") from exc
+
+
+def _check_socket_dir(directory: Path) -> None:
+    """Create directory private to this user, or check that an existing one is.
+
+    Whoever controls the directory holding the default socket could put
+    their own socket there and read the image paths clients send.
+    """
+    directory.mkdir(mode=0o700, exist_ok=True)
+    info = directory.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise RuntimeError(f"{directory} must be a directory only the current user can access")
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    try:
+        mode = socket_path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise RuntimeError(f"{socket_path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except ConnectionRefusedError:
+            socket_path.unlink()  # stale socket from a previous run
+        else:
+            raise RuntimeError(f"OCR daemon already running on {socket_path}")
+
+
+def serve(
+    socket_path: Path,
+    lang: str = "eng",
+    psm: Optional[int] = None,
+    oem: Optional[int] = None,
+) -> int:
+    """Run the OCR daemon until interrupted."""
+    _ensure_tesseract_available()
+    _enable_jit()
+    if tesserocr is not None:
+        # Load the expected engine up front so the first request is warm.
+        _get_api(lang, psm, oem)
+    try:
+        server = make_daemon(socket_path)
+    except (RuntimeError, OSError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+    with server:
+        print(f"Listening on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+    return 0
+
+
+def ocr_via_daemon(socket_path: Path, image_path: Path, options: dict[str, Any]) -> str:
+    """OCR image_path through a running daemon (see serve)."""
+    request = {"path": str(image_path.resolve()), "options": options}
+    try:
+        if socket_path == DEFAULT_SOCKET:
+            _check_socket_dir(socket_path.parent)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                reply = json.loads(f.readline())
+    except OSError as exc:
+        raise RuntimeError(
+            f"Cannot reach OCR daemon at {socket_path}: {exc}\n"
+            "Start one with: python ocr.py --daemon"
+        ) from exc
+    if "error" in reply:
+        raise RuntimeError(reply["error"])
+    return reply["text"]
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Extract text from an image using Tesseract OCR.")
-    p.add_argument("image", type=Path, help="Path to the input image file")
+    p.add_argument(
+        "image",
+        type=Path,
+        nargs="*",
+        help="Input image file(s), directories, or glob patterns",
+    )
     p.add_argument("-l", "--lang", default="eng", help="Language(s), e.g., 'eng', 'eng+deu'")
     p.add_argument("--psm", type=int, default=None, help="Tesseract Page Segmentation Mode (e.g., 6)")
     p.add_argument("--oem", type=int, default=None, help="Tesseract OCR Engine Mode (0-3)")
@@ -153,51 +876,135 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default=None,
         help="Binarization threshold 0-255 (omit for auto/none)",
     )
+    p.add_argument(
+        "--binarize",
+        choices=BINARIZE_MODES,
+        default="none",
+        help="Automatic binarization when --threshold is not given "
+        "('adaptive' requires OpenCV)",
+    )
     p.add_argument(
         "--denoise",
         choices=["median", "blur"],
         default=None,
         help="Optional denoise filter before thresholding",
     )
+    p.add_argument(
+        "--max-dim",
+        type=int,
+        default=None,
+        help="Downscale images whose longer side exceeds this many pixels (e.g., 2000)",
+    )
+    p.add_argument(
+        "--tile-rows",
+        type=int,
+        default=None,
+        help="Split tall pages into up to N horizontal bands (cut on blank rows) "
+        "and OCR them in parallel",
+    )
     p.add_argument(
         "--deskew",
         action="store_true",
         help="Auto-rotate using Tesseract OSD to correct skew",
     )
-    p.add_argument("-o", "--output", type=Path, default=None, help="Optional output .txt path")
-    return p.parse_args(argv)
+    p.add_argument(
+        "--fast-deskew",
+        action="store_true",
+        help="Like --deskew, but skip OSD when a quick check finds horizontal text "
+        "lines (upside-down pages are not corrected)",
+    )
+    p.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Optional output .txt path (output directory when OCR'ing several images)",
+    )
+    p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for several images (default: CPU count)",
+    )
+    mode = p.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run a server that keeps Tesseract loaded and OCRs images for --client",
+    )
+    mode.add_argument(
+        "--client",
+        action="store_true",
+        help="Send the images to a running --daemon instead of OCR'ing in this process",
+    )
+    p.add_argument(
+        "--socket",
+        type=Path,
+        default=DEFAULT_SOCKET,
+        help=f"Unix socket used by --daemon/--client (default: {DEFAULT_SOCKET})",
+    )
+    args = p.parse_args(argv)
+    if not args.image and not args.daemon:
+        p.error("the following arguments are required: image")
+    if args.max_dim is not None and args.max_dim <= 0:
+        p.error("--max-dim must be a positive number of pixels")
+    return args
 
 
 def main(argv: Optional[list[str]] = None) -> int:
     args = parse_args(argv or sys.argv[1:])
 
-    if not args.image.exists():
-        print(f"Error: File not found: {args.image}", file=sys.stderr)
+    if args.daemon:
+        return serve(args.socket, lang=args.lang, psm=args.psm, oem=args.oem)
+
+    images = _expand_inputs(args.image)
+    if not images:
+        print("Error: No input images found", file=sys.stderr)
         return 2
+    for image in images:
+        if not image.exists():
+            print(f"Error: File not found: {image}", file=sys.stderr)
+            return 2
 
-    try:
-        text = ocr_image(
-            args.image,
-            lang=args.lang,
-            psm=args.psm,
-            oem=args.oem,
-            threshold=args.threshold,
-            grayscale=not args.no_grayscale,
-            sharpen=not args.no_sharpen,
-            denoise=args.denoise,
-            deskew=args.deskew,
+    options = dict(
+        lang=args.lang,
+        psm=args.psm,
+        oem=args.oem,
+        threshold=args.threshold,
+        grayscale=not args.no_grayscale,
+        sharpen=not args.no_sharpen,
+        denoise=args.denoise,
+        deskew=args.deskew,
+        fast_deskew=args.fast_deskew,
+        binarize=None if args.binarize == "none" else args.binarize,
+        max_dim=args.max_dim,
+        tile_rows=args.tile_rows,
+    )
+
+    # Directories and globs always use batch output, even if they match one file.
+    if len(images) > 1 or images != args.image:
+        return _run_batch(
+            images, options, args.output, args.jobs, args.socket if args.client else None
         )
+
+    try:
+        if args.client:
+            text = ocr_via_daemon(args.socket, images[0], options)
+        else:
+            text = ocr_image(images[0], **options)
     except Exception as exc:
         print(f"OCR failed: {exc}", file=sys.stderr)
         return 1
 
+    data = text.encode("utf-8")
     if args.output:
         args.output.parent.mkdir(parents=True, exist_ok=True)
-        args.output.write_text(text, encoding="utf-8")
+        args.output.write_bytes(data)
         print(f"Wrote: {args.output}")
     else:
         # Print to stdout
-        sys.stdout.write(text)
+        _write_stdout(data)
 
     return 0
 
@@ -1,5 +1,6 @@
 import os
 import shutil
+import socket
 from pathlib import Path
 
 import pytest
@@ -44,3 +45,335 @@ def test_ocr_on_generated_sample(tmp_path: Path) -> None:
     norm = " ".join(text.split())
     assert "Hello OCR 123" in norm
     assert "This is a test image." in norm
+
+
+def test_expand_inputs_directories_and_globs(tmp_path: Path) -> None:
+    for name in ("b.png", "a.jpg", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+
+    ocr = _load_ocr_module()
+    assert ocr._expand_inputs([tmp_path]) == [tmp_path / "a.jpg", tmp_path / "b.png"]
+    assert ocr._expand_inputs([tmp_path / "*.png"]) == [tmp_path / "b.png"]
+    assert ocr._expand_inputs([tmp_path / "a.jpg"]) == [tmp_path / "a.jpg"]
+
+
+def test_main_ocrs_every_listed_file(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    images = [tmp_path / "a.png", tmp_path / "b.png"]
+    for image in images:
+        image.write_bytes(b"")
+
+    ocr = _load_ocr_module()
+    seen = []
+    ocr.ocr_image = lambda path, **options: seen.append(path) or f"text of {path.name}\n"
+
+    assert ocr.main([str(p) for p in images] + ["-j", "1"]) == 0
+    assert seen == images
+    out = capsys.readouterr().out
+    assert "text of a.png" in out and "text of b.png" in out
+
+
+def test_main_rejects_output_file(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    images = [tmp_path / "a.png", tmp_path / "b.png"]
+    for image in images:
+        image.write_bytes(b"")
+    output = tmp_path / "out.txt"
+    output.write_text("keep me")
+
+    ocr = _load_ocr_module()
+    ocr.ocr_image = lambda path, **options: "text"
+
+    assert ocr.main([str(p) for p in images] + ["-j", "1", "-o", str(output)]) == 2
+    assert "is not a directory" in capsys.readouterr().err
+    assert output.read_text() == "keep me"
+
+
+def test_output_names_keep_suffix_on_stem_clash(tmp_path: Path) -> None:
+    ocr = _load_ocr_module()
+    a_png, a_jpg, b_png = tmp_path / "a.png", tmp_path / "a.jpg", tmp_path / "b.png"
+    assert ocr._output_names([a_png, a_jpg, b_png]) == {
+        a_png: "a.png.txt",
+        a_jpg: "a.jpg.txt",
+        b_png: "b.txt",
+    }
+    with pytest.raises(ValueError):
+        ocr._output_names([tmp_path / "x" / "a.png", tmp_path / "y" / "a.png"])
+
+
+def test_preprocess_threshold_binarizes() -> None:
+    from PIL import Image
+
+    ocr = _load_ocr_module()
+    img = Image.frombytes("L", (4, 1), bytes([0, 100, 101, 255]))
+    out = ocr.preprocess_image(img, sharpen=False, threshold=100)
+    assert out.tobytes() == bytes([0, 0, 255, 255])
+
+
+def test_otsu_threshold_separates_bimodal_histogram() -> None:
+    import numpy as np
+
+    ocr = _load_ocr_module()
+    gray = np.array([20] * 50 + [30] * 50 + [200] * 60 + [220] * 40, dtype=np.uint8)
+    assert 30 <= ocr._otsu_threshold(gray) < 200
+
+
+def test_looks_upright_on_synthetic_pages() -> None:
+    import numpy as np
+    from PIL import Image, ImageDraw
+
+    ocr = _load_ocr_module()
+    rng = np.random.default_rng(0)
+    page = Image.new("L", (400, 300), color=255)
+    draw = ImageDraw.Draw(page)
+    for top in range(20, 280, 40):
+        x = int(rng.integers(10, 30))
+        while x < 380:
+            width = int(rng.integers(15, 50))
+            draw.rectangle((x, top, min(x + width, 390), top + 15), fill=0)
+            x += width + int(rng.integers(6, 14))
+
+    assert ocr._looks_upright(page)
+    assert not ocr._looks_upright(page.rotate(90, expand=True, fillcolor=255))
+    assert not ocr._looks_upright(page.rotate(270, expand=True, fillcolor=255))
+
+
+def test_load_image_decodes_jpeg_to_grayscale(tmp_path: Path) -> None:
+    from PIL import Image
+
+    path = tmp_path / "page.jpg"
+    Image.new("RGB", (40, 30), color=(200, 120, 40)).save(path)
+    ocr = _load_ocr_module()
+    ocr._turbojpeg = lambda: None
+
+    img = ocr.load_image(path, "L")
+    assert img.mode == "L" and img.size == (40, 30)
+
+
+def test_load_image_falls_back_to_pil_when_turbojpeg_fails(tmp_path: Path) -> None:
+    from PIL import Image
+
+    path = tmp_path / "page.jpg"
+    Image.new("RGB", (40, 30), color=(200, 120, 40)).save(path)
+    ocr = _load_ocr_module()
+    calls = []
+
+    class FailingDecoder:
+        def decode(self, data: bytes, pixel_format: int) -> None:
+            calls.append(pixel_format)
+            raise OSError("Unsupported color conversion request")
+
+    ocr._turbojpeg = lambda: FailingDecoder()
+    ocr.TJPF_GRAY, ocr.TJPF_RGB = 0, 1
+
+    for mode in ("L", "RGB"):
+        img = ocr.load_image(path, mode)
+        assert img.mode == mode and img.size == (40, 30)
+    assert calls == [0, 1]
+
+
+def test_downscale_image_caps_longer_side() -> None:
+    from PIL import Image
+
+    ocr = _load_ocr_module()
+    img = Image.new("L", (4000, 1000), color=255)
+    assert ocr.downscale_image(img, 2000).size == (2000, 500)
+    assert ocr.downscale_image(img, 5000) is img
+    assert ocr.downscale_image(img, None) is img
+    assert ocr.downscale_image(img, -5) is img
+    with pytest.raises(SystemExit):
+        ocr.parse_args(["page.png", "--max-dim", "0"])
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+def test_daemon_round_trip(tmp_path: Path) -> None:
+    import tempfile
+    import threading
+
+    ocr = _load_ocr_module()
+    ocr.ocr_image = lambda path, **options: f"{path.name} {options['lang']}"
+
+    with tempfile.TemporaryDirectory() as sock_dir:
+        socket_path = Path(sock_dir) / "ocr.sock"
+        with ocr.make_daemon(socket_path) as server:
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                text = ocr.ocr_via_daemon(socket_path, tmp_path / "page.png", {"lang": "deu"})
+                with pytest.raises(RuntimeError):
+                    ocr.ocr_via_daemon(socket_path, tmp_path / "page.png", {"bogus": 1})
+            finally:
+                server.shutdown()
+
+    assert text == "page.png deu"
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+def test_make_daemon_only_replaces_stale_sockets() -> None:
+    import tempfile
+
+    ocr = _load_ocr_module()
+    with tempfile.TemporaryDirectory() as sock_dir:
+        regular = Path(sock_dir) / "notes.txt"
+        regular.write_text("keep me")
+        with pytest.raises(RuntimeError):
+            ocr.make_daemon(regular)
+        assert regular.read_text() == "keep me"
+
+        socket_path = Path(sock_dir) / "ocr.sock"
+        with ocr.make_daemon(socket_path):
+            with pytest.raises(RuntimeError, match="already running"):
+                ocr.make_daemon(socket_path)
+
+        # The closed server left its socket file behind; it is stale now.
+        assert socket_path.exists()
+        with ocr.make_daemon(socket_path):
+            pass
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+def test_default_socket_dir_must_be_private(tmp_path: Path) -> None:
+    ocr = _load_ocr_module()
+    private = tmp_path / "private"
+    ocr._check_socket_dir(private)
+    assert private.stat().st_mode & 0o777 == 0o700
+
+    private.chmod(0o755)
+    with pytest.raises(RuntimeError, match="only the current user"):
+        ocr._check_socket_dir(private)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+def test_serve_reports_socket_errors(tmp_path: Path, capsys) -> None:
+    ocr = _load_ocr_module()
+    ocr._ensure_tesseract_available = lambda: True
+    ocr.tesserocr = None
+
+    assert ocr.serve(tmp_path / "missing" / "ocr.sock") == 2
+    assert "Error: Cannot listen on" in capsys.readouterr().err
+
+
+def test_split_bands_cuts_on_blank_rows() -> None:
+    from PIL import Image, ImageDraw
+
+    ocr = _load_ocr_module()
+    img = Image.new("L", (50, 300), color=255)
+    draw = ImageDraw.Draw(img)
+    for top in (10, 110, 210):
+        draw.rectangle((5, top, 45, top + 60), fill=0)
+
+    bands = ocr.split_bands(img, 3)
+    assert len(bands) == 3
+    assert sum(band.height for band in bands) == img.height
+    for band in bands:
+        # Every band holds one whole stripe: its first and last rows are blank.
+        assert min(band.crop((0, 0, 50, 1)).getextrema()) == 255
+        assert min(band.crop((0, band.height - 1, 50, band.height)).getextrema()) == 255
+
+    assert ocr.split_bands(Image.new("L", (10, 10), color=0), 4)[0].size == (10, 10)
+
+
+def test_ocr_bands_keeps_band_order() -> None:
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from PIL import Image
+
+    ocr = _load_ocr_module()
+
+    def recognize(band, lang, psm, oem):
+        # Later bands finish first, so a result joined by completion would be reversed.
+        time.sleep((5 - band.height) / 100)
+        return f"band {band.height}\n\f"
+
+    ocr._recognize = recognize
+    ocr._band_executor = lambda workers: ThreadPoolExecutor(workers)
+    bands = [Image.new("L", (4, height)) for height in (1, 2, 3, 4)]
+
+    text = ocr._ocr_bands(bands, "eng", None, None)
+
+    assert text == "band 1\nband 2\nband 3\nband 4\n\f"
+
+
+def test_preprocess_leaves_binary_images_alone() -> None:
+    from PIL import Image
+
+    ocr = _load_ocr_module()
+    img = Image.new("1", (8, 8), color=1)
+    assert ocr.preprocess_image(img, threshold=128) is img
+    assert ocr.preprocess_image(img, denoise="median").mode == "L"
+
+
+def test_sharpen_threshold_kernel_matches_pil(monkeypatch) -> None:
+    import numpy as np
+    from PIL import Image
+
+    numba = pytest.importorskip("numba")
+    ocr = _load_ocr_module()
+    kernel = ocr._compile_sharpen_threshold(numba)
+    monkeypatch.setattr(ocr, "cv2", None)
+
+    rng = np.random.default_rng(0)
+    for shape in [(37, 53), (2, 5), (1, 1)]:
+        gray = rng.integers(0, 256, shape).astype(np.uint8)
+        img = Image.fromarray(gray)
+        for threshold in range(256):
+            expected = ocr.preprocess_image(img, sharpen=True, threshold=threshold)
+            actual = kernel(gray, threshold)
+            assert np.array_equal(actual, np.asarray(expected)), (shape, threshold)
+
+
+class _StubTessAPI:
+    """Stand-in for tesserocr.PyTessBaseAPI that records how it is used."""
+
+    instances: list["_StubTessAPI"] = []
+
+    def __init__(self, lang: str = "eng", psm: int = 3, oem: int = 3) -> None:
+        self.init_args = (lang, psm, oem)
+        self.psm_calls: list[int] = []
+        self.orient_deg = 0
+        _StubTessAPI.instances.append(self)
+
+    def SetPageSegMode(self, psm: int) -> None:
+        self.psm_calls.append(psm)
+
+    def SetImageBytes(self, data: bytes, width: int, height: int, bpp: int, bpl: int) -> None:
+        assert len(data) == height * bpl
+
+    def DetectOrientationScript(self) -> dict:
+        return {"orient_deg": self.orient_deg}
+
+
+def _load_ocr_with_stub_tesserocr():
+    import types
+
+    ocr = _load_ocr_module()
+    _StubTessAPI.instances = []
+    ocr.tesserocr = types.SimpleNamespace(PyTessBaseAPI=_StubTessAPI)
+    return ocr
+
+
+def test_get_api_caches_per_lang_oem_and_sets_psm_only_on_change() -> None:
+    ocr = _load_ocr_with_stub_tesserocr()
+
+    api = ocr._get_api("eng", 6, None)
+    assert ocr._get_api("eng", 6, None) is api
+    assert ocr._get_api("eng", 4, None) is api
+    assert ocr._get_api("eng", 4, None) is api
+    assert ocr._get_api("eng", None, None) is api
+    assert api.psm_calls == [4, 3]
+
+    other = ocr._get_api("eng", 6, 1)
+    assert other is not api
+    assert [inst.init_args for inst in _StubTessAPI.instances] == [("eng", 6, 3), ("eng", 6, 1)]
+    assert other.psm_calls == []
+
+
+def test_detect_rotation_converts_orient_deg_to_clockwise_rotate() -> None:
+    from PIL import Image
+
+    ocr = _load_ocr_with_stub_tesserocr()
+    img = Image.new("L", (20, 10), color=255)
+    osd_api = ocr._get_api("osd", ocr._PSM_OSD_ONLY, None)
+
+    for orient_deg, rotate in ((0, 0), (90, 270), (180, 180), (270, 90)):
+        osd_api.orient_deg = orient_deg
+        assert ocr._detect_rotation(img) == rotate
+    assert len(_StubTessAPI.instances) == 1